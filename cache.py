@@ -0,0 +1,155 @@
+"""
+Response cache module - persistent HTTP cache with conditional revalidation
+"""
+import re
+import sqlite3
+import time
+from typing import Dict, NamedTuple, Optional
+
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+
+class CacheEntry(NamedTuple):
+    """Cached response body and its validators"""
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+    final_url: Optional[str] = None
+
+
+class ResponseCache:
+    """SQLite-backed cache of successful HTML responses
+
+    Entries are served directly while fresh. Stale entries are
+    revalidated with If-None-Match / If-Modified-Since, so unchanged
+    pages come back as a bodyless 304.
+    """
+
+    def __init__(self, path: str = '.scraper_cache.sqlite', expire_after: float = 3600):
+        """Initialize cache
+
+        Args:
+            path: SQLite database file
+            expire_after: Seconds a response stays fresh when the server
+                sends no Cache-Control max-age
+        """
+        self.path = path
+        self.expire_after = expire_after
+        self._conn = sqlite3.connect(path)
+        # WAL with NORMAL sync commits without an fsync per page; the
+        # async crawler stores from the event-loop thread
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'url TEXT PRIMARY KEY, body TEXT, etag TEXT, '
+            'last_modified TEXT, expires_at REAL, final_url TEXT)'
+        )
+        # Databases created before final_url was tracked lack the column
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(responses)')}
+        if 'final_url' not in columns:
+            self._conn.execute('ALTER TABLE responses ADD COLUMN final_url TEXT')
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Look up a cached response
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Cache entry or None if not cached
+        """
+        row = self._conn.execute(
+            'SELECT body, etag, last_modified, expires_at, final_url FROM responses WHERE url = ?',
+            (url,)
+        ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    @staticmethod
+    def is_fresh(entry: CacheEntry) -> bool:
+        """Check whether an entry can be used without revalidation"""
+        return time.time() < entry.expires_at
+
+    @staticmethod
+    def validators(entry: CacheEntry) -> Dict[str, str]:
+        """Build conditional request headers for a stale entry
+
+        Args:
+            entry: Cached entry
+
+        Returns:
+            Dictionary of headers (may be empty)
+        """
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def store(self, url: str, body: str, headers, final_url: Optional[str] = None) -> None:
+        """Store a 200 response unless the server forbids it
+
+        Args:
+            url: Request URL (or lookup key)
+            body: Response text
+            headers: Response headers (case-insensitive mapping)
+            final_url: URL the response was served from after redirects
+        """
+        expires_at = self._expires_at(headers)
+        if expires_at is None:
+            return
+
+        with self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses '
+                '(url, body, etag, last_modified, expires_at, final_url) VALUES (?, ?, ?, ?, ?, ?)',
+                (url, body, headers.get('ETag'), headers.get('Last-Modified'), expires_at, final_url)
+            )
+
+    def refresh(self, url: str, headers) -> None:
+        """Extend the lifetime of an entry after a 304 Not Modified
+
+        Args:
+            url: Request URL
+            headers: Response headers (case-insensitive mapping)
+        """
+        expires_at = self._expires_at(headers)
+        with self._conn:
+            if expires_at is None:
+                self._conn.execute('DELETE FROM responses WHERE url = ?', (url,))
+            else:
+                self._conn.execute(
+                    'UPDATE responses SET expires_at = ? WHERE url = ?',
+                    (expires_at, url)
+                )
+
+    def _expires_at(self, headers) -> Optional[float]:
+        """Compute expiry time from Cache-Control
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+
+        Returns:
+            Expiry timestamp, or None if the response must not be stored
+        """
+        cache_control = (headers.get('Cache-Control') or '').lower()
+
+        if 'no-store' in cache_control:
+            return None
+        if 'no-cache' in cache_control:
+            return time.time()
+
+        max_age = _MAX_AGE_RE.search(cache_control)
+        lifetime = int(max_age.group(1)) if max_age else self.expire_after
+        return time.time() + lifetime
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        with self._conn:
+            self._conn.execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self._conn.close()
@@ -2,9 +2,31 @@
 Configuration module for the web scraper
 """
 import json
-from typing import Dict, List, Optional
+import os
+from functools import cached_property
+from importlib.util import find_spec
+from types import SimpleNamespace
+from typing import Dict, FrozenSet, List, Optional
 from pathlib import Path
 
+from jsonschema import Draft202012Validator, ValidationError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Config files larger than this are streamed instead of loaded whole
+STREAM_LOAD_THRESHOLD = 1 << 20
+
+# Only advertise Brotli when the decoder is installed
+ACCEPT_ENCODING = 'gzip, deflate, br' if find_spec('brotli') else 'gzip, deflate'
+
 
 class Config:
     """Configuration manager for scraper settings"""
@@ -13,7 +35,10 @@ class Config:
         "target_url": "https://example.com",
         "max_pages": 10,
         "delay_between_requests": 2,
+        "concurrency": 8,
         "timeout": 30,
+        "use_cache": True,
+        "cache_expire_after": 3600,
         "follow_links": True,
         "max_depth": 3,
         "allowed_domains": [],
@@ -29,6 +54,34 @@ class Config:
         "export_fields": ["url", "title", "content", "timestamp"]
     }
 
+    SCHEMA = {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "object",
+        "properties": {
+            "target_url": {"type": "string"},
+            "max_pages": {"type": "integer", "minimum": 1},
+            "delay_between_requests": {"type": "number", "minimum": 0},
+            "concurrency": {"type": "integer", "minimum": 1},
+            "timeout": {"type": "number", "exclusiveMinimum": 0},
+            "use_cache": {"type": "boolean"},
+            "cache_expire_after": {"type": "number", "minimum": 0},
+            "follow_links": {"type": "boolean"},
+            "max_depth": {"type": "integer", "minimum": 0},
+            "allowed_domains": {"type": "array", "items": {"type": "string"}},
+            "selectors": {"type": "object", "additionalProperties": {"type": "string"}},
+            "output_format": {"enum": ["json", "jsonl", "csv", "parquet", "both"]},
+            "output_file": {"type": "string"},
+            "user_agent": {"type": "string"},
+            "headers": {"type": "object", "additionalProperties": {"type": "string"}},
+            "export_fields": {"type": "array", "items": {"type": "string"}}
+        },
+        "required": list(DEFAULT_CONFIG),
+        "additionalProperties": False
+    }
+
+    # Derived values computed on first access and reset on every change
+    _CACHED_PROPERTIES = ('_headers', 'allowed_domain_set', 'settings')
+
     def __init__(self, config_file: Optional[str] = None):
         """Initialize configuration
 
@@ -40,6 +93,20 @@ class Config:
         if config_file and Path(config_file).exists():
             self.load_from_file(config_file)
 
+        self.validate()
+
+    def validate(self) -> None:
+        """Validate configuration against SCHEMA
+
+        Raises:
+            ValueError: If a value is missing, unknown or of the wrong type
+        """
+        try:
+            Draft202012Validator(self.SCHEMA).validate(self.config)
+        except ValidationError as e:
+            location = '.'.join(str(part) for part in e.absolute_path) or 'config'
+            raise ValueError(f"Invalid configuration at '{location}': {e.message}") from e
+
     def load_from_file(self, config_file: str) -> None:
         """Load configuration from JSON file
 
@@ -47,13 +114,37 @@ class Config:
             config_file: Path to config file
         """
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                user_config = json.load(f)
-                self.config.update(user_config)
+            if ijson is not None and os.path.getsize(config_file) > STREAM_LOAD_THRESHOLD:
+                self.config.update(self._stream_load(config_file))
+            elif orjson is not None:
+                with open(config_file, 'rb') as f:
+                    self.config.update(orjson.loads(f.read()))
+            else:
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    self.config.update(json.load(f))
+            self._invalidate_cache()
         except Exception as e:
             print(f"⚠️  Error loading config file: {e}")
             print("Using default configuration")
 
+    def _stream_load(self, config_file: str) -> Dict:
+        """Parse a large JSON config one top-level entry at a time
+
+        Entries are collected into a new dict so that a file which fails
+        partway through leaves the current configuration untouched.
+
+        Args:
+            config_file: Path to config file
+
+        Returns:
+            Dictionary of all top-level entries
+        """
+        loaded = {}
+        with open(config_file, 'rb') as f:
+            for key, value in ijson.kvitems(f, '', use_float=True):
+                loaded[key] = value
+        return loaded
+
     def save_to_file(self, config_file: str) -> None:
         """Save current configuration to JSON file
 
@@ -61,7 +152,7 @@ class Config:
             config_file: Path to save config
         """
         with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=4)
+            f.write(str(self))
 
     def get(self, key: str, default=None):
         """Get configuration value
@@ -83,6 +174,7 @@ class Config:
             value: Value to set
         """
         self.config[key] = value
+        self._invalidate_cache()
 
     def update(self, updates: Dict) -> None:
         """Update multiple configuration values
@@ -91,18 +183,47 @@ class Config:
             updates: Dictionary of updates
         """
         self.config.update(updates)
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        """Drop derived values so they are recomputed on next access"""
+        for name in self._CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def settings(self) -> SimpleNamespace:
+        """Attribute view of the configuration for hot code paths
+
+        Every key is guaranteed present once the config has been
+        validated, so callers can use settings.timeout instead of
+        config.get('timeout', 30). Treat it as read-only; use set()
+        or update() to change values.
+        """
+        return SimpleNamespace(**self.config)
+
+    @cached_property
+    def allowed_domain_set(self) -> FrozenSet[str]:
+        """Allowed domains as a frozenset for O(1) membership checks"""
+        return frozenset(self.config.get('allowed_domains', []))
 
     def get_headers(self) -> Dict[str, str]:
         """Get HTTP headers for requests
 
+        The dictionary is built once and shared; do not modify it.
+
         Returns:
             Dictionary of headers
         """
+        return self._headers
+
+    @cached_property
+    def _headers(self) -> Dict[str, str]:
+        """Build HTTP headers from the current configuration"""
         headers = {
             'User-Agent': self.config['user_agent'],
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
         }
         headers.update(self.config.get('headers', {}))
@@ -110,4 +231,6 @@ class Config:
 
     def __str__(self) -> str:
         """String representation of config"""
+        if orjson is not None:
+            return orjson.dumps(self.config, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.config, indent=2)
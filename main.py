@@ -12,10 +12,18 @@ from colorama import init, Fore, Style
 init(autoreset=True)
 
 from config import Config
-from scraper import WebScraper
+from scraper import AsyncWebScraper
 from storage import DataStorage
 
 
+def positive_int(value: str) -> int:
+    """argparse type for integer options that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def print_banner():
     """Print application banner"""
     banner = f"""
@@ -73,7 +81,7 @@ Examples:
     parser.add_argument(
         '--max-pages',
         help='Maximum pages to crawl (default: 10)',
-        type=int,
+        type=positive_int,
         default=10
     )
 
@@ -84,10 +92,17 @@ Examples:
         default=2
     )
 
+    parser.add_argument(
+        '--concurrency',
+        help='Number of concurrent crawl workers (default: config value, 8)',
+        type=positive_int,
+        default=None
+    )
+
     parser.add_argument(
         '-o', '--output',
-        help='Output format: json, csv, or both (default: json)',
-        choices=['json', 'csv', 'both'],
+        help='Output format: json, jsonl, csv, parquet, or both (default: json)',
+        choices=['json', 'jsonl', 'csv', 'parquet', 'both'],
         default='json'
     )
 
@@ -116,6 +131,12 @@ Examples:
         default=30
     )
 
+    parser.add_argument(
+        '--no-cache',
+        help='Ignore and do not update the on-disk response cache',
+        action='store_true'
+    )
+
     parser.add_argument(
         '--allowed-domains',
         help='Comma-separated list of allowed domains for crawling',
@@ -154,7 +175,11 @@ def main():
 
     try:
         # Load configuration
-        config = Config(args.config) if args.config else Config()
+        try:
+            config = Config(args.config) if args.config else Config()
+        except ValueError as e:
+            print(f"{Fore.RED}✗ Error: {e}{Style.RESET_ALL}")
+            sys.exit(1)
 
         # Override config with command line arguments
         if args.url:
@@ -166,12 +191,18 @@ def main():
         if args.delay:
             config.set('delay_between_requests', args.delay)
 
+        if args.concurrency is not None:
+            config.set('concurrency', args.concurrency)
+
         if args.output:
             config.set('output_format', args.output)
 
         if args.timeout:
             config.set('timeout', args.timeout)
 
+        if args.no_cache:
+            config.set('use_cache', False)
+
         if args.allowed_domains:
             domains = [d.strip() for d in args.allowed_domains.split(',')]
             config.set('allowed_domains', domains)
@@ -182,6 +213,13 @@ def main():
         if args.selector:
             config.config['selectors']['custom'] = args.selector
 
+        # set() does not check values, so validate the merged result
+        try:
+            config.validate()
+        except ValueError as e:
+            print(f"{Fore.RED}✗ Error: {e}{Style.RESET_ALL}")
+            sys.exit(1)
+
         # Display configuration
         print(f"{Fore.CYAN}📋 Configuration:{Style.RESET_ALL}")
         print(f"  Target URL: {config.get('target_url')}")
@@ -192,7 +230,7 @@ def main():
         print()
 
         # Initialize components
-        scraper = WebScraper(config)
+        scraper = AsyncWebScraper(config)
         storage = DataStorage(config)
 
         # Scrape data
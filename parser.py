@@ -1,12 +1,87 @@
 """
 HTML parser module - flexible parsing with CSS selectors
 """
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional, Any
-from urllib.parse import urljoin, urlparse
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+from typing import Dict, List, Optional, Any, Pattern, Union
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
 from datetime import datetime
+import functools
 import re
 
+# Precompiled XPath expressions shared by all parser instances
+_TITLE_XPATH = etree.XPath('//title')
+_H1_XPATH = etree.XPath('//h1')
+_META_DESCRIPTION_XPATH = etree.XPath('//meta[@name="description"]')
+_LINK_XPATH = etree.XPath('//a[@href]')
+_IMAGE_XPATH = etree.XPath('//img[@src]')
+_NON_CONTENT_XPATH = etree.XPath('//script | //style | //nav | //footer | //header')
+_TABLE_XPATH = etree.XPath('//table')
+_ROW_XPATH = etree.XPath('.//tr')
+_CELL_XPATH = etree.XPath('.//th | .//td')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+# Absolute http(s) URL with a non-empty host
+_HTTP_URL_RE = re.compile(r'https?://[^/\s?#]+', re.IGNORECASE)
+# Zero-width characters that \s does not match
+_ZERO_WIDTH_TABLE = str.maketrans('', '', '\u200b\u200c\u200d\u2060\ufeff')
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_css(selector: str) -> CSSSelector:
+    """Compile a CSS selector, caching the result by selector string"""
+    return CSSSelector(selector, translator='html')
+
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+@functools.lru_cache(maxsize=100_000)
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so equivalent spellings compare equal
+
+    Lowercases scheme and host, drops default ports and the fragment,
+    sorts query parameters and strips a trailing slash from the path.
+    The result is a lookup key for de-duplication and caching only; it
+    is not always the same resource, so never fetch it or resolve
+    relative links against it.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Canonical URL
+    """
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = parts.hostname or ''
+    if ':' in host:
+        host = f"[{host}]"  # IPv6 literal
+
+    netloc = host
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{port}"
+    if parts.username is not None:
+        userinfo = parts.netloc.rpartition('@')[0]
+        netloc = f"{userinfo}@{netloc}"
+
+    path = parts.path.rstrip('/') or '/'
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_regex(pattern: str) -> Pattern:
+    """Compile a regex, caching the result by pattern string"""
+    return re.compile(pattern)
+
 
 class HTMLParser:
     """HTML parser with flexible selector support"""
@@ -18,7 +93,32 @@ class HTMLParser:
             config: Configuration object
         """
         self.config = config
-        self.selectors = config.get('selectors', {})
+        self.selectors = config.settings.selectors
+        self._compile_selectors()
+
+    def _compile_selectors(self) -> None:
+        """Compile configured selectors once, keyed by field name"""
+        self._compiled_selectors: Dict[str, CSSSelector] = {
+            name: _compile_css(selector) for name, selector in self.selectors.items()
+        }
+
+    def _parse_tree(self, html: str) -> lxml_html.HtmlElement:
+        """Parse HTML into an lxml document tree
+
+        Args:
+            html: HTML string
+
+        Returns:
+            Root element of the document
+        """
+        try:
+            return lxml_html.document_fromstring(html)
+        except ValueError:
+            # lxml rejects str input carrying an XML encoding declaration
+            return lxml_html.document_fromstring(html.encode('utf-8'))
+        except etree.ParserError:
+            # Empty document
+            return lxml_html.document_fromstring('<html></html>')
 
     def parse(self, html: str, url: str) -> Dict[str, Any]:
         """Parse HTML content
@@ -30,106 +130,114 @@ class HTMLParser:
         Returns:
             Dictionary of extracted data
         """
-        soup = BeautifulSoup(html, 'lxml')
+        tree = self._parse_tree(html)
 
         data = {
             'url': url,
             'timestamp': datetime.now().isoformat(),
-            'title': self._extract_title(soup),
-            'meta_description': self._extract_meta_description(soup),
+            'title': self._extract_title(tree),
+            'meta_description': self._extract_meta_description(tree),
         }
 
         # Extract data based on configured selectors
-        for field_name, selector in self.selectors.items():
+        for field_name, selector in self._compiled_selectors.items():
             if field_name in ['title', 'meta_description']:
                 continue  # Already extracted
 
-            data[field_name] = self._extract_by_selector(soup, selector)
+            data[field_name] = self._extract_by_selector(tree, selector)
 
-        # Additional extraction methods
-        data['links'] = self.extract_links(html, url)
-        data['images'] = self.extract_images(soup, url)
-        data['text_content'] = self._extract_text(soup)
+        # Additional extraction methods (text last, it strips elements)
+        data['links'] = self.extract_links(tree, url)
+        data['images'] = self.extract_images(tree, url)
+        data['text_content'] = self._extract_text(tree)
 
         return data
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, tree: lxml_html.HtmlElement) -> str:
         """Extract page title
 
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed lxml document
 
         Returns:
             Page title
         """
         # Try title tag first
-        if soup.title:
-            title_text = soup.title.get_text(strip=True)
+        titles = _TITLE_XPATH(tree)
+        if titles:
+            title_text = titles[0].text_content().strip()
             if title_text:
                 return title_text
 
         # Try h1 tag
-        h1 = soup.find('h1')
+        h1 = _H1_XPATH(tree)
         if h1:
-            return h1.get_text(strip=True)
+            return h1[0].text_content().strip()
 
         # Try custom selector
         if 'title' in self.selectors:
-            title_elem = soup.select_one(self.selectors['title'])
-            if title_elem:
-                return title_elem.get_text(strip=True)
+            title_elems = self._compiled_selectors['title'](tree)
+            if title_elems:
+                return title_elems[0].text_content().strip()
 
         return 'No title'
 
-    def _extract_meta_description(self, soup: BeautifulSoup) -> str:
+    def _extract_meta_description(self, tree: lxml_html.HtmlElement) -> str:
         """Extract meta description
 
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed lxml document
 
         Returns:
             Meta description or empty string
         """
-        meta = soup.find('meta', attrs={'name': 'description'})
-        if meta and meta.get('content'):
-            return meta['content'].strip()
+        meta = _META_DESCRIPTION_XPATH(tree)
+        if meta and meta[0].get('content'):
+            return meta[0].get('content').strip()
         return ''
 
-    def _extract_by_selector(self, soup: BeautifulSoup, selector: str) -> List[str]:
+    def _extract_by_selector(self, tree: lxml_html.HtmlElement,
+                             selector: Union[str, CSSSelector]) -> List[str]:
         """Extract elements by CSS selector
 
         Args:
-            soup: BeautifulSoup object
-            selector: CSS selector
+            tree: Parsed lxml document
+            selector: CSS selector string or compiled selector
 
         Returns:
             List of extracted text
         """
-        elements = soup.select(selector)
-        return [elem.get_text(strip=True) for elem in elements if elem.get_text(strip=True)]
+        if isinstance(selector, str):
+            selector = _compile_css(selector)
+
+        texts = (elem.text_content().strip() for elem in selector(tree))
+        return [text for text in texts if text]
 
-    def _extract_text(self, soup: BeautifulSoup) -> str:
-        """Extract main text content
+    def _extract_text(self, tree: lxml_html.HtmlElement) -> str:
+        """Extract main text content of the page body
+
+        Non-content elements are removed from the tree in place, so call
+        this after every other extraction.
 
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed lxml document
 
         Returns:
             Cleaned text content
         """
         # Remove script and style elements
-        for script in soup(['script', 'style', 'nav', 'footer', 'header']):
-            script.decompose()
+        for element in _NON_CONTENT_XPATH(tree):
+            element.drop_tree()
+        body = tree.find('body')
+        text = body.text_content() if body is not None else ''
 
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
+        return _WHITESPACE_RE.sub(' ', text.translate(_ZERO_WIDTH_TABLE)).strip()
 
-        return text
+    def extract_links_from_html(self, html: str, base_url: str) -> List[str]:
+        """Extract all links from raw HTML
 
-    def extract_links(self, html: str, base_url: str) -> List[str]:
-        """Extract all links from page
+        Prefer the 'links' field returned by parse() when the page is
+        parsed anyway; this parses the HTML again.
 
         Args:
             html: HTML content
@@ -138,30 +246,50 @@ class HTMLParser:
         Returns:
             List of absolute URLs
         """
-        soup = BeautifulSoup(html, 'lxml')
+        return self.extract_links(self._parse_tree(html), base_url)
+
+    def extract_links(self, tree: lxml_html.HtmlElement, base_url: str) -> List[str]:
+        """Extract all links from page
+
+        Args:
+            tree: Parsed lxml document
+            base_url: Base URL for resolving relative links
+
+        Returns:
+            List of unique absolute URLs in document order
+        """
         links = []
+        seen = set()
 
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
+        for a_tag in _LINK_XPATH(tree):
+            href = a_tag.get('href')
 
-            # Skip anchors and javascript
-            if href.startswith('#') or href.startswith('javascript:'):
+            # Skip empty hrefs, anchors and javascript (first-char check
+            # avoids the startswith calls for ordinary links)
+            if not href or (href[0] in '#j' and (href[0] == '#' or href.startswith('javascript:'))):
                 continue
 
             # Convert to absolute URL
             absolute_url = urljoin(base_url, href)
 
             # Validate URL
-            if self._is_valid_url(absolute_url):
+            if not self._is_valid_url(absolute_url):
+                continue
+
+            # De-duplicate on the canonical form, but keep the URL as
+            # written so it is fetched exactly as the page links it
+            url_key = canonicalize_url(absolute_url)
+            if url_key not in seen:
+                seen.add(url_key)
                 links.append(absolute_url)
 
-        return list(set(links))  # Remove duplicates
+        return links
 
-    def extract_images(self, soup: BeautifulSoup, base_url: str) -> List[str]:
+    def extract_images(self, tree: lxml_html.HtmlElement, base_url: str) -> List[str]:
         """Extract all image URLs
 
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed lxml document
             base_url: Base URL for resolving relative paths
 
         Returns:
@@ -169,8 +297,8 @@ class HTMLParser:
         """
         images = []
 
-        for img in soup.find_all('img', src=True):
-            src = img['src']
+        for img in _IMAGE_XPATH(tree):
+            src = img.get('src')
             absolute_url = urljoin(base_url, src)
             images.append(absolute_url)
 
@@ -185,17 +313,13 @@ class HTMLParser:
         Returns:
             True if valid, False otherwise
         """
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc]) and result.scheme in ['http', 'https']
-        except:
-            return False
+        return _HTTP_URL_RE.match(url) is not None
 
-    def extract_structured_data(self, soup: BeautifulSoup, schema: Dict) -> Dict:
+    def extract_structured_data(self, tree: lxml_html.HtmlElement, schema: Dict) -> Dict:
         """Extract data based on custom schema
 
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed lxml document
             schema: Dictionary defining extraction rules
 
         Returns:
@@ -206,48 +330,49 @@ class HTMLParser:
         for field, rule in schema.items():
             if isinstance(rule, str):
                 # Simple CSS selector
-                data[field] = self._extract_by_selector(soup, rule)
+                data[field] = self._extract_by_selector(tree, rule)
             elif isinstance(rule, dict):
                 # Advanced extraction with options
                 selector = rule.get('selector')
                 attribute = rule.get('attribute')
                 regex = rule.get('regex')
 
-                elements = soup.select(selector)
+                elements = _compile_css(selector)(tree)
 
                 if attribute:
                     data[field] = [elem.get(attribute) for elem in elements if elem.get(attribute)]
                 elif regex:
-                    pattern = re.compile(regex)
-                    data[field] = [pattern.search(elem.get_text()).group() for elem in elements if pattern.search(elem.get_text())]
+                    pattern = _compile_regex(regex)
+                    matches = (pattern.search(elem.text_content()) for elem in elements)
+                    data[field] = [match.group() for match in matches if match]
                 else:
-                    data[field] = [elem.get_text(strip=True) for elem in elements]
+                    data[field] = [elem.text_content().strip() for elem in elements]
 
         return data
 
-    def extract_table_data(self, soup: BeautifulSoup) -> List[Dict]:
+    def extract_table_data(self, tree: lxml_html.HtmlElement) -> List[Dict]:
         """Extract data from HTML tables
 
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed lxml document
 
         Returns:
             List of dictionaries representing table rows
         """
         tables_data = []
 
-        for table in soup.find_all('table'):
+        for table in _TABLE_XPATH(tree):
             headers = []
             rows = []
+            table_rows = _ROW_XPATH(table)
 
             # Extract headers
-            header_row = table.find('tr')
-            if header_row:
-                headers = [th.get_text(strip=True) for th in header_row.find_all(['th', 'td'])]
+            if table_rows:
+                headers = [th.text_content().strip() for th in _CELL_XPATH(table_rows[0])]
 
             # Extract rows
-            for tr in table.find_all('tr')[1:]:
-                cells = [td.get_text(strip=True) for td in tr.find_all(['td', 'th'])]
+            for tr in table_rows[1:]:
+                cells = [td.text_content().strip() for td in _CELL_XPATH(tr)]
                 if cells:
                     if headers and len(headers) == len(cells):
                         rows.append(dict(zip(headers, cells)))
@@ -261,3 +386,33 @@ class HTMLParser:
                 })
 
         return tables_data
+
+
+# Parser owned by each worker process, created by init_parse_worker
+_worker_parser: Optional[HTMLParser] = None
+
+
+def init_parse_worker(config) -> None:
+    """Initializer for parse worker processes
+
+    Builds the process-local parser once, so selectors are compiled per
+    worker instead of the parser being pickled with every page.
+
+    Args:
+        config: Configuration object
+    """
+    global _worker_parser
+    _worker_parser = HTMLParser(config)
+
+
+def parse_html_worker(html: str, url: str) -> Dict[str, Any]:
+    """Parse a page in a worker process set up by init_parse_worker
+
+    Args:
+        html: HTML string
+        url: Source URL
+
+    Returns:
+        Dictionary of extracted data
+    """
+    return _worker_parser.parse(html, url)
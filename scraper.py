@@ -1,16 +1,40 @@
 """
 Web scraper module - handles HTTP requests and page crawling
 """
-import requests
+import asyncio
+import functools
+import os
+import httpx
+import aiohttp
 import time
-from typing import Optional, Set, List
-from urllib.parse import urljoin, urlparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Set, List, Dict, Deque, Tuple
+from urllib.parse import urljoin, urlsplit
 from colorama import Fore, Style
 import logging
+import sys
+
+from cache import ResponseCache
+from parser import canonicalize_url
+from storage import ScrapeResults
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# HTTP client libraries log every request/connection at INFO
+for _name in ('httpx', 'httpcore', 'urllib3'):
+    logging.getLogger(_name).setLevel(logging.WARNING)
+
+# Only color log output when it goes to a terminal
+if sys.stderr.isatty():
+    _GREEN, _YELLOW, _RED, _CYAN, _RESET = Fore.GREEN, Fore.YELLOW, Fore.RED, Fore.CYAN, Style.RESET_ALL
+else:
+    _GREEN = _YELLOW = _RED = _CYAN = _RESET = ''
+
+# Log a progress line every N scraped pages
+PROGRESS_INTERVAL = 100
+
 
 class WebScraper:
     """Web scraper class for fetching web pages"""
@@ -22,10 +46,28 @@ class WebScraper:
             config: Configuration object
         """
         self.config = config
-        self.session = requests.Session()
-        self.session.headers.update(config.get_headers())
+        # HTTP/2 lets requests to the same host share one TLS connection
+        self.session = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            headers=config.get_headers(),
+            timeout=config.settings.timeout
+        )
+        self.cache = (
+            ResponseCache(expire_after=config.settings.cache_expire_after)
+            if config.settings.use_cache else None
+        )
+        # visited_urls and _queued hold canonical keys (canonicalize_url);
+        # the queue itself holds URLs as linked, which are what is fetched.
+        # visited_urls is for de-duplication only; the max_pages budget
+        # counts fetch attempts in pages_visited.
         self.visited_urls: Set[str] = set()
-        self.urls_to_visit: List[str] = []
+        self.pages_visited = 0
+        self.urls_to_visit: Deque[str] = deque()
+        self._queued: Set[str] = set()
+        self._allowed_domains = config.allowed_domain_set
+        self._domain_allowed = functools.lru_cache(maxsize=8192)(self._match_domain)
+        self._host_next_ok: Dict[str, float] = {}
 
     def fetch_page(self, url: str) -> Optional[str]:
         """Fetch a single page
@@ -36,42 +78,85 @@ class WebScraper:
         Returns:
             HTML content or None if failed
         """
+        page = self._fetch(url)
+        return page[0] if page else None
+
+    def _fetch(self, url: str, delay: float = 0) -> Optional[Tuple[str, str]]:
+        """Fetch a page and report the URL it was served from
+
+        Args:
+            url: URL to fetch
+            delay: Minimum seconds between network requests to the same
+                host; fresh cache hits are returned without waiting
+
+        Returns:
+            Tuple of (HTML content, final URL after redirects) or None if failed
+        """
         try:
-            logger.info(f"Fetching: {url}")
-
-            response = self.session.get(
-                url,
-                timeout=self.config.get('timeout', 30),
-                allow_redirects=True
-            )
-
-            if response.status_code == 200:
-                logger.info(f"{Fore.GREEN}✓ Success: {url}{Style.RESET_ALL}")
-                return response.text
-            elif response.status_code == 404:
-                logger.warning(f"{Fore.YELLOW}⚠ 404 Not Found: {url}{Style.RESET_ALL}")
-                return None
-            elif response.status_code == 403:
-                logger.warning(f"{Fore.RED}⚠ 403 Forbidden: {url}{Style.RESET_ALL}")
-                return None
-            else:
-                logger.warning(f"{Fore.YELLOW}⚠ Status {response.status_code}: {url}{Style.RESET_ALL}")
-                return None
+            cache_key = canonicalize_url(url)
+            cached = self.cache.get(cache_key) if self.cache else None
+            if cached and self.cache.is_fresh(cached):
+                logger.debug("Cached: %s", url)
+                return cached.body, cached.final_url or url
+
+            self._wait_for_host(url, delay)
+            logger.info("Fetching: %s", url)
+
+            headers = self.cache.validators(cached) if cached else None
+            response = self.session.get(url, headers=headers, follow_redirects=True)
+
+            if response.status_code == 304 and cached:
+                self.cache.refresh(cache_key, response.headers)
+                return cached.body, cached.final_url or url
+
+            if self._check_status(response.status_code, url):
+                html = response.text
+                final_url = str(response.url)
+                if self.cache:
+                    self.cache.store(cache_key, html, response.headers, final_url)
+                return html, final_url
+            return None
 
-        except requests.exceptions.Timeout:
-            logger.error(f"{Fore.RED}✗ Timeout: {url}{Style.RESET_ALL}")
+        except httpx.TimeoutException:
+            logger.error("%s✗ Timeout: %s%s", _RED, url, _RESET)
             return None
-        except requests.exceptions.ConnectionError:
-            logger.error(f"{Fore.RED}✗ Connection Error: {url}{Style.RESET_ALL}")
+        except httpx.NetworkError:
+            logger.error("%s✗ Connection Error: %s%s", _RED, url, _RESET)
             return None
-        except requests.exceptions.RequestException as e:
-            logger.error(f"{Fore.RED}✗ Request failed: {url} - {e}{Style.RESET_ALL}")
+        except httpx.HTTPError as e:
+            logger.error("%s✗ Request failed: %s - %s%s", _RED, url, e, _RESET)
             return None
         except Exception as e:
-            logger.error(f"{Fore.RED}✗ Unexpected error: {url} - {e}{Style.RESET_ALL}")
+            logger.error("%s✗ Unexpected error: %s - %s%s", _RED, url, e, _RESET)
             return None
 
-    def crawl(self, start_url: str, max_pages: Optional[int] = None) -> List[dict]:
+    def _check_status(self, status: int, url: str) -> bool:
+        """Log the outcome of a response status code
+
+        Args:
+            status: HTTP status code
+            url: Requested URL
+
+        Returns:
+            True if the response body should be used, False otherwise
+        """
+        if status == 200:
+            logger.debug("%s✓ Success: %s%s", _GREEN, url, _RESET)
+            return True
+        elif status == 404:
+            logger.warning("%s⚠ 404 Not Found: %s%s", _YELLOW, url, _RESET)
+        elif status == 403:
+            logger.warning("%s⚠ 403 Forbidden: %s%s", _RED, url, _RESET)
+        else:
+            logger.warning("%s⚠ Status %s: %s%s", _YELLOW, status, url, _RESET)
+        return False
+
+    def clear_cache(self) -> None:
+        """Remove all cached responses so the next fetches hit the network"""
+        if self.cache:
+            self.cache.clear()
+
+    def crawl(self, start_url: str, max_pages: Optional[int] = None) -> ScrapeResults:
         """Crawl website starting from URL
 
         Args:
@@ -79,53 +164,102 @@ class WebScraper:
             max_pages: Maximum pages to crawl (None = unlimited)
 
         Returns:
-            List of scraped page data
+            Scraped page data
         """
         from parser import HTMLParser
 
         parser = HTMLParser(self.config)
-        results = []
+        results = ScrapeResults()
 
-        self.urls_to_visit = [start_url]
-        max_pages = max_pages or self.config.get('max_pages', 10)
+        self.urls_to_visit = deque([start_url])
+        self._queued = {canonicalize_url(start_url)}
+        settings = self.config.settings
+        max_pages = max_pages or settings.max_pages
+        delay = settings.delay_between_requests
+        follow_links = settings.follow_links
 
-        logger.info(f"\n{Fore.CYAN}🚀 Starting crawl from: {start_url}{Style.RESET_ALL}")
-        logger.info(f"Max pages: {max_pages}\n")
+        logger.info("\n%s🚀 Starting crawl from: %s%s", _CYAN, start_url, _RESET)
+        logger.info("Max pages: %d\n", max_pages)
 
-        while self.urls_to_visit and len(self.visited_urls) < max_pages:
-            current_url = self.urls_to_visit.pop(0)
+        while self.urls_to_visit and self.pages_visited < max_pages:
+            current_url = self.urls_to_visit.popleft()
+            url_key = canonicalize_url(current_url)
+            self._queued.discard(url_key)
 
-            if current_url in self.visited_urls:
+            if url_key in self.visited_urls:
                 continue
 
             if not self._is_allowed_domain(current_url):
-                logger.info(f"Skipping (domain not allowed): {current_url}")
+                logger.info("Skipping (domain not allowed): %s", current_url)
                 continue
 
-            html = self.fetch_page(current_url)
-            self.visited_urls.add(current_url)
+            page = self._fetch(current_url, delay)
+            self.visited_urls.add(url_key)
+            self.pages_visited += 1
 
-            if html:
-                # Parse page
-                page_data = parser.parse(html, current_url)
-                results.append(page_data)
+            if page:
+                html, final_url = page
+                # A redirect target counts as visited too
+                self.visited_urls.add(canonicalize_url(final_url))
 
-                # Find new links to crawl
-                if self.config.get('follow_links', False):
-                    new_links = parser.extract_links(html, current_url)
-                    self._add_links_to_queue(new_links)
+                # Parse page against the URL it was served from, so
+                # relative links resolve like they do in a browser
+                page_data = parser.parse(html, final_url)
+                results.append_row(page_data)
+                self._log_progress(results)
 
-            # Rate limiting
-            delay = self.config.get('delay_between_requests', 1)
-            if delay > 0 and self.urls_to_visit:
-                time.sleep(delay)
+                # Queue links found while parsing
+                if follow_links:
+                    self._add_links_to_queue(page_data['links'])
 
-        logger.info(f"\n{Fore.GREEN}✓ Crawl complete!{Style.RESET_ALL}")
-        logger.info(f"Pages visited: {len(self.visited_urls)}")
-        logger.info(f"Pages scraped: {len(results)}\n")
+        logger.info("\n%s✓ Crawl complete!%s", _GREEN, _RESET)
+        logger.info("Pages visited: %d", self.pages_visited)
+        logger.info("Pages scraped: %d\n", len(results))
 
         return results
 
+    def _log_progress(self, results: ScrapeResults) -> None:
+        """Log a progress line every PROGRESS_INTERVAL scraped pages
+
+        Args:
+            results: Pages scraped so far
+        """
+        if len(results) % PROGRESS_INTERVAL == 0:
+            logger.info("Progress: %d pages scraped, %d visited", len(results), self.pages_visited)
+
+    def _reserve_host_slot(self, url: str, delay: float) -> float:
+        """Book the next request slot for the URL's host
+
+        Each host gets its own schedule, so requests to different hosts
+        are not delayed by each other.
+
+        Args:
+            url: URL about to be fetched
+            delay: Minimum seconds between requests to the same host
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        host = urlsplit(url).netloc
+        now = time.monotonic()
+        ready_at = max(self._host_next_ok.get(host, now), now)
+        self._host_next_ok[host] = ready_at + delay
+        return ready_at - now
+
+    def _wait_for_host(self, url: str, delay: float) -> None:
+        """Sleep until the URL's host may be requested again
+
+        Args:
+            url: URL about to be fetched
+            delay: Minimum seconds between requests to the same host
+        """
+        if delay <= 0:
+            return
+
+        wait = self._reserve_host_slot(url, delay)
+        if wait > 0:
+            time.sleep(wait)
+
     def _is_allowed_domain(self, url: str) -> bool:
         """Check if URL domain is allowed
 
@@ -135,15 +269,24 @@ class WebScraper:
         Returns:
             True if allowed, False otherwise
         """
-        allowed_domains = self.config.get('allowed_domains', [])
-
-        if not allowed_domains:
+        if not self._allowed_domains:
             return True
 
-        parsed = urlparse(url)
-        domain = parsed.netloc
+        return self._domain_allowed(urlsplit(url).netloc)
+
+    def _match_domain(self, domain: str) -> bool:
+        """Match a host against allowed domains (results are cached per host)
+
+        Args:
+            domain: Network location of a URL
+
+        Returns:
+            True if allowed, False otherwise
+        """
+        if domain in self._allowed_domains:
+            return True
 
-        return any(allowed in domain for allowed in allowed_domains)
+        return any(allowed in domain for allowed in self._allowed_domains)
 
     def _add_links_to_queue(self, links: List[str]) -> None:
         """Add new links to crawl queue
@@ -152,7 +295,9 @@ class WebScraper:
             links: List of URLs to add
         """
         for link in links:
-            if link not in self.visited_urls and link not in self.urls_to_visit:
+            url_key = canonicalize_url(link)
+            if url_key not in self.visited_urls and url_key not in self._queued:
+                self._queued.add(url_key)
                 self.urls_to_visit.append(link)
 
     def scrape_single_page(self, url: str) -> Optional[dict]:
@@ -168,7 +313,237 @@ class WebScraper:
 
         parser = HTMLParser(self.config)
 
-        html = self.fetch_page(url)
-        if html:
-            return parser.parse(html, url)
+        page = self._fetch(url)
+        if page:
+            html, final_url = page
+            return parser.parse(html, final_url)
         return None
+
+
+class AsyncWebScraper(WebScraper):
+    """Concurrent web scraper built on asyncio and aiohttp"""
+
+    def __init__(self, config):
+        """Initialize scraper
+
+        Args:
+            config: Configuration object
+
+        Raises:
+            ValueError: If concurrency is below 1
+        """
+        super().__init__(config)
+        self.concurrency = config.settings.concurrency
+        if self.concurrency < 1:
+            # With no workers, waiting on the queue would never return
+            raise ValueError(f"concurrency must be at least 1, got {self.concurrency}")
+
+    def crawl(self, start_url: str, max_pages: Optional[int] = None) -> ScrapeResults:
+        """Crawl website starting from URL using concurrent workers
+
+        Args:
+            start_url: Starting URL
+            max_pages: Maximum pages to crawl (None = unlimited)
+
+        Returns:
+            Scraped page data
+        """
+        return asyncio.run(self._crawl_async(start_url, max_pages))
+
+    async def _crawl_async(self, start_url: str, max_pages: Optional[int] = None) -> ScrapeResults:
+        """Run the crawl on the event loop
+
+        Args:
+            start_url: Starting URL
+            max_pages: Maximum pages to crawl (None = unlimited)
+
+        Returns:
+            Scraped page data
+        """
+        from parser import init_parse_worker
+
+        results = ScrapeResults()
+
+        self.urls_to_visit = asyncio.Queue()
+        self.urls_to_visit.put_nowait(start_url)
+        self._queued = {canonicalize_url(start_url)}
+        max_pages = max_pages or self.config.settings.max_pages
+
+        logger.info("\n%s🚀 Starting crawl from: %s%s", _CYAN, start_url, _RESET)
+        logger.info("Max pages: %d, workers: %d\n", max_pages, self.concurrency)
+
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=8, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=self.config.settings.timeout)
+
+        # Parsing is CPU-bound, so run it in worker processes while the
+        # event loop keeps fetching. Each process builds its parser once.
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=init_parse_worker,
+            initargs=(self.config,)
+        ) as pool:
+            async with aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers=self.config.get_headers()
+            ) as session:
+                workers = [
+                    asyncio.create_task(self._worker(session, pool, results, max_pages))
+                    for _ in range(self.concurrency)
+                ]
+
+                await self.urls_to_visit.join()
+
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+        logger.info("\n%s✓ Crawl complete!%s", _GREEN, _RESET)
+        logger.info("Pages visited: %d", self.pages_visited)
+        logger.info("Pages scraped: %d\n", len(results))
+
+        return results
+
+    async def _worker(self, session: aiohttp.ClientSession, pool: ProcessPoolExecutor,
+                      results: ScrapeResults, max_pages: int) -> None:
+        """Consume URLs from the queue until cancelled
+
+        Args:
+            session: Shared HTTP session
+            pool: Executor used for parsing
+            results: Container collecting scraped page data
+            max_pages: Maximum pages to crawl
+        """
+        from parser import parse_html_worker
+
+        loop = asyncio.get_running_loop()
+        settings = self.config.settings
+        delay = settings.delay_between_requests
+        follow_links = settings.follow_links
+
+        while True:
+            current_url = await self.urls_to_visit.get()
+            url_key = canonicalize_url(current_url)
+            self._queued.discard(url_key)
+            try:
+                # Check-and-add has no await in between, so it is atomic
+                # on the event loop and needs no lock
+                if url_key in self.visited_urls or self.pages_visited >= max_pages:
+                    continue
+
+                if not self._is_allowed_domain(current_url):
+                    logger.info("Skipping (domain not allowed): %s", current_url)
+                    continue
+
+                self.visited_urls.add(url_key)
+                self.pages_visited += 1
+
+                page = await self._fetch_async(session, current_url, delay)
+
+                if page:
+                    html, final_url = page
+                    # A redirect target counts as visited too
+                    self.visited_urls.add(canonicalize_url(final_url))
+
+                    # Parse page against the URL it was served from, so
+                    # relative links resolve like they do in a browser
+                    page_data = await loop.run_in_executor(pool, parse_html_worker, html, final_url)
+                    results.append_row(page_data)
+                    self._log_progress(results)
+
+                    # Queue links found while parsing
+                    if follow_links:
+                        self._add_links_to_queue(page_data['links'])
+            except Exception as e:
+                logger.error("%s✗ Failed to process: %s - %s%s", _RED, current_url, e, _RESET)
+            finally:
+                self.urls_to_visit.task_done()
+
+    async def _wait_for_host_async(self, url: str, delay: float) -> None:
+        """Wait until the URL's host may be requested again, without blocking
+
+        Args:
+            url: URL about to be fetched
+            delay: Minimum seconds between requests to the same host
+        """
+        if delay <= 0:
+            return
+
+        wait = self._reserve_host_slot(url, delay)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def fetch_page_async(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
+        """Fetch a single page without blocking the event loop
+
+        Args:
+            session: Shared HTTP session
+            url: URL to fetch
+
+        Returns:
+            HTML content or None if failed
+        """
+        page = await self._fetch_async(session, url)
+        return page[0] if page else None
+
+    async def _fetch_async(self, session: aiohttp.ClientSession, url: str,
+                           delay: float = 0) -> Optional[Tuple[str, str]]:
+        """Fetch a page without blocking and report the URL it was served from
+
+        Args:
+            session: Shared HTTP session
+            url: URL to fetch
+            delay: Minimum seconds between network requests to the same
+                host; fresh cache hits are returned without waiting
+
+        Returns:
+            Tuple of (HTML content, final URL after redirects) or None if failed
+        """
+        try:
+            cache_key = canonicalize_url(url)
+            cached = self.cache.get(cache_key) if self.cache else None
+            if cached and self.cache.is_fresh(cached):
+                logger.debug("Cached: %s", url)
+                return cached.body, cached.final_url or url
+
+            await self._wait_for_host_async(url, delay)
+            logger.info("Fetching: %s", url)
+
+            headers = self.cache.validators(cached) if cached else None
+            async with session.get(url, headers=headers, allow_redirects=True) as response:
+                if response.status == 304 and cached:
+                    self.cache.refresh(cache_key, response.headers)
+                    return cached.body, cached.final_url or url
+
+                if self._check_status(response.status, url):
+                    html = await response.text(errors='replace')
+                    final_url = str(response.url)
+                    if self.cache:
+                        self.cache.store(cache_key, html, response.headers, final_url)
+                    return html, final_url
+                return None
+
+        except asyncio.TimeoutError:
+            logger.error("%s✗ Timeout: %s%s", _RED, url, _RESET)
+            return None
+        except aiohttp.ClientConnectionError:
+            logger.error("%s✗ Connection Error: %s%s", _RED, url, _RESET)
+            return None
+        except aiohttp.ClientError as e:
+            logger.error("%s✗ Request failed: %s - %s%s", _RED, url, e, _RESET)
+            return None
+        except Exception as e:
+            logger.error("%s✗ Unexpected error: %s - %s%s", _RED, url, e, _RESET)
+            return None
+
+    def _add_links_to_queue(self, links: List[str]) -> None:
+        """Add new links to crawl queue
+
+        Args:
+            links: List of URLs to add
+        """
+        for link in links:
+            url_key = canonicalize_url(link)
+            if url_key not in self.visited_urls and url_key not in self._queued:
+                self._queued.add(url_key)
+                self.urls_to_visit.put_nowait(link)
@@ -1,15 +1,165 @@
 """
 Storage module - handles data export to various formats
 """
+import atexit
 import json
 import csv
-from typing import List, Dict, Any
+import mmap
+import operator
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
 from pathlib import Path
-from datetime import datetime
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
 logger = logging.getLogger(__name__)
 
+_UNSAFE_RE = re.compile(r'[^\w\s-]')
+_COLLAPSE_RE = re.compile(r'[-\s]+')
+
+# Write buffer for export files. Nothing calls flush() or fsync(); data
+# reaches the OS when the buffer fills and when the file is closed
+_WRITE_BUFFER = 1 << 20
+
+# append_to_json write-behind: flush when this many lines are queued, or
+# after APPEND_FLUSH_INTERVAL seconds otherwise
+APPEND_BATCH_SIZE = 256
+APPEND_FLUSH_INTERVAL = 0.1
+
+# Exact-type membership for the CSV flatten loop (no subclass walk)
+_SEQ_TYPES = frozenset((list, tuple))
+
+
+# Placeholder in ScrapeResults.extra columns for pages without that field
+_MISSING = object()
+
+
+def _join_values(values) -> str:
+    """Join a list field into one comma-separated string, skipping empty items"""
+    # Links and images are all str, so skip the per-item str() call
+    if values and type(values[0]) is str:
+        try:
+            return ', '.join([v for v in values if v])
+        except TypeError:
+            pass
+    return ', '.join([str(v) for v in values if v])
+
+
+class ScrapeResults:
+    """Column-oriented container for scraped pages
+
+    Each page field is kept in its own list instead of one dict per
+    page; links and images hold one list per page. Iterating yields
+    page dicts in the same shape HTMLParser.parse returns. Rows share
+    their link and image lists with the container, so treat them as
+    read-only.
+    """
+
+    _CORE_FIELDS = frozenset([
+        'url', 'timestamp', 'title', 'meta_description', 'links', 'images', 'text_content'
+    ])
+
+    def __init__(self):
+        """Initialize empty columns"""
+        self.urls: List[str] = []
+        self.timestamps: List[str] = []
+        self.titles: List[str] = []
+        self.meta_descriptions: List[str] = []
+        self.text_contents: List[str] = []
+        self.links: List[List[str]] = []
+        self.images: List[List[str]] = []
+        self.extra: Dict[str, List[Any]] = {}  # Selector fields by name
+        self._sparse = False  # Some extra column holds _MISSING
+
+    def append_row(self, page: Dict[str, Any]) -> None:
+        """Append one page as returned by HTMLParser.parse
+
+        Args:
+            page: Page data dictionary
+        """
+        count = len(self.urls)
+
+        self.urls.append(page.get('url'))
+        self.timestamps.append(page.get('timestamp'))
+        self.titles.append(page.get('title'))
+        self.meta_descriptions.append(page.get('meta_description'))
+        self.text_contents.append(page.get('text_content') or '')
+        self.links.append(page.get('links') or [])
+        self.images.append(page.get('images') or [])
+
+        for key, value in page.items():
+            if key in self._CORE_FIELDS:
+                continue
+            column = self.extra.get(key)
+            if column is None:
+                column = self.extra[key] = [_MISSING] * count
+                if count:
+                    self._sparse = True
+            column.append(value)
+
+        # Pad columns this page did not have
+        for column in self.extra.values():
+            if len(column) == count:
+                column.append(_MISSING)
+                self._sparse = True
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Rebuild the page dict at index"""
+        if index < 0:
+            index += len(self.urls)
+
+        row = {
+            'url': self.urls[index],
+            'timestamp': self.timestamps[index],
+            'title': self.titles[index],
+            'meta_description': self.meta_descriptions[index],
+        }
+        for key, column in self.extra.items():
+            value = column[index]
+            if value is not _MISSING:
+                row[key] = value
+        row['links'] = self.links[index]
+        row['images'] = self.images[index]
+        row['text_content'] = self.text_contents[index]
+        return row
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        # Same rows as __getitem__, but zipped across all columns and
+        # built by dict() in C instead of one Python-level row at a time
+        keys = ('url', 'timestamp', 'title', 'meta_description',
+                *self.extra, 'links', 'images', 'text_content')
+        columns = zip(self.urls, self.timestamps, self.titles, self.meta_descriptions,
+                      *self.extra.values(), self.links, self.images, self.text_contents)
+        rows = map(dict, map(zip, repeat(keys), columns))
+
+        if not self._sparse:
+            return rows
+        return ({key: value for key, value in row.items() if value is not _MISSING}
+                for row in rows)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Convert to a list of page dicts"""
+        return list(self)
+
 
 class DataStorage:
     """Data storage and export handler"""
@@ -23,13 +173,49 @@ class DataStorage:
         self.config = config
         self.output_dir = Path('output')
         self.output_dir.mkdir(exist_ok=True)
+        # Plain string prefix; per-save paths are built with f-strings
+        # rather than allocating a Path for every file
+        self._out = str(self.output_dir) + os.sep
+
+        # Write-behind queue of (filepath, line) for append_to_json
+        self._append_queue = deque()
+        self._flush_lock = threading.Lock()
+        self._pending = threading.Event()      # queue may be non-empty
+        self._batch_ready = threading.Event()  # full batch queued, or closing
+        self._flusher = None
+        self._flush_error = None
+        self._closed = False
+
+    def __enter__(self) -> 'DataStorage':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the append flusher thread and write any queued lines
+
+        Raises:
+            OSError: If queued lines could not be written
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._flusher is not None:
+            self._pending.set()
+            self._batch_ready.set()
+            self._flusher.join()
+            atexit.unregister(self.flush)
+
+        self.flush()
 
-    def save(self, data: List[Dict[str, Any]], format: str = None) -> str:
+    def save(self, data: Union[ScrapeResults, List[Dict[str, Any]]], format: str = None) -> str:
         """Save data in specified format
 
         Args:
             data: List of dictionaries to save
-            format: Output format ('json', 'csv', or 'both')
+            format: Output format ('json', 'jsonl', 'csv', 'parquet', or 'both')
 
         Returns:
             Path to saved file(s)
@@ -41,111 +227,394 @@ class DataStorage:
         format = format or self.config.get('output_format', 'json')
         base_filename = self.config.get('output_file', 'scraped_data')
 
+        # One timestamp so paired JSON/CSV files share a name
+        timestamp = self._timestamp()
         saved_files = []
 
-        if format in ['json', 'both']:
-            json_file = self.save_json(data, base_filename)
+        if format == 'both':
+            # The two files are independent, so their writes can overlap
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                json_future = executor.submit(self.save_json, data, base_filename, timestamp)
+                # Flatten list input here while the JSON encode runs, then
+                # hand it over so save_csv does no flattening of its own;
+                # ScrapeResults are read column-wise by save_csv itself
+                flat = None
+                csv_file = None
+                if not isinstance(data, ScrapeResults):
+                    try:
+                        flat = self._flatten_data(data)
+                    except Exception as e:
+                        logger.error(f"✗ Error saving CSV: {e}")
+                        csv_file = ""
+                if csv_file is None:
+                    csv_file = executor.submit(
+                        self.save_csv, data, base_filename, timestamp, flat
+                    ).result()
+                saved_files = [json_future.result(), csv_file]
+
+        elif format == 'json':
+            json_file = self.save_json(data, base_filename, timestamp)
             saved_files.append(json_file)
 
-        if format in ['csv', 'both']:
-            csv_file = self.save_csv(data, base_filename)
+        elif format == 'jsonl':
+            jsonl_file = self.save_jsonl(data, base_filename, timestamp)
+            saved_files.append(jsonl_file)
+
+        elif format == 'csv':
+            csv_file = self.save_csv(data, base_filename, timestamp)
             saved_files.append(csv_file)
 
+        elif format == 'parquet':
+            parquet_file = self.save_parquet(data, base_filename, timestamp)
+            saved_files.append(parquet_file)
+
         return ', '.join(saved_files)
 
-    def save_json(self, data: List[Dict[str, Any]], filename: str) -> str:
+    @staticmethod
+    def _timestamp() -> str:
+        """Current local time as YYYYMMDD_HHMMSS for filenames"""
+        t = time.localtime()
+        return (f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}_"
+                f"{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}")
+
+    def save_json(self, data: List[Dict[str, Any]], filename: str,
+                  timestamp: Optional[str] = None, compact: bool = True) -> str:
         """Save data as JSON
 
         Args:
             data: Data to save
             filename: Base filename
+            timestamp: Filename timestamp (default: now)
+            compact: Write without indentation (smaller and faster);
+                set False for human-readable output
 
         Returns:
             Path to saved file
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filepath = self.output_dir / f"{filename}_{timestamp}.json"
+        timestamp = timestamp or self._timestamp()
+        filepath = f"{self._out}{filename}_{timestamp}.json"
+
+        if isinstance(data, ScrapeResults):
+            data = data.to_records()
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._write_json(filepath, data, compact)
 
             logger.info(f"✓ JSON saved: {filepath}")
-            return str(filepath)
+            return filepath
 
         except Exception as e:
             logger.error(f"✗ Error saving JSON: {e}")
             return ""
 
-    def save_csv(self, data: List[Dict[str, Any]], filename: str) -> str:
+    def _write_json(self, filepath: str, data: Any, compact: bool = True) -> None:
+        """Write data as JSON, using orjson when available
+
+        Without orjson, compact output is streamed to disk chunk by chunk
+        so the full document is never held in memory as one string.
+
+        Args:
+            filepath: Target file
+            data: Data to serialize
+            compact: Omit indentation
+        """
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if not compact:
+                option |= orjson.OPT_INDENT_2
+            with open(filepath, 'wb', buffering=_WRITE_BUFFER) as f:
+                f.write(orjson.dumps(data, option=option))
+        elif compact:
+            encoder = json.JSONEncoder(ensure_ascii=False)
+            with open(filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+                for chunk in encoder.iterencode(data):
+                    f.write(chunk)
+        else:
+            with open(filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+    def save_jsonl(self, data_iter: Iterable[Dict[str, Any]], filename: str,
+                   timestamp: Optional[str] = None) -> str:
+        """Save records as JSON Lines, one document per line
+
+        Records are serialized and written one at a time, so the input
+        may be a generator and is never materialized as a whole. The file
+        is opened for appending; passing the same timestamp again adds to
+        an existing file.
+
+        Args:
+            data_iter: Iterable of records (list, ScrapeResults, generator)
+            filename: Base filename
+            timestamp: Filename timestamp (default: now)
+
+        Returns:
+            Path to saved file
+        """
+        timestamp = timestamp or self._timestamp()
+        filepath = f"{self._out}{filename}_{timestamp}.jsonl"
+
+        try:
+            dump_line = self._ndjson_line
+            with open(filepath, 'ab', buffering=_WRITE_BUFFER) as f:
+                for item in data_iter:
+                    f.write(dump_line(item))
+
+            logger.info(f"✓ JSONL saved: {filepath}")
+            return filepath
+
+        except Exception as e:
+            logger.error(f"✗ Error saving JSONL: {e}")
+            return ""
+
+    @staticmethod
+    def _ndjson_line(record: Any) -> bytes:
+        """Serialize one record as a newline-terminated UTF-8 JSON line"""
+        if orjson is not None:
+            return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS) + b'\n'
+        return json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n'
+
+    def load_ndjson(self, filename: str) -> List[Any]:
+        """Read a JSON Lines file from the output directory
+
+        The file is memory-mapped and split into lines in a single C call
+        instead of being framed line by line by the file iterator.
+
+        Args:
+            filename: File name inside the output directory
+
+        Returns:
+            List of records, one per non-empty line (empty if the file
+            is missing or empty)
+        """
+        filepath = f"{self._out}{filename}"
+        loads = orjson.loads if orjson is not None else json.loads
+
+        # Include records still waiting in the append queue
+        self.flush()
+
+        try:
+            with open(filepath, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return []
+
+        try:
+            return [loads(line) for line in mm[:].split(b'\n') if line.strip()]
+        finally:
+            mm.close()
+
+    def save_csv(self, data: List[Dict[str, Any]], filename: str,
+                 timestamp: Optional[str] = None,
+                 flat_data: Optional[Tuple[List[Dict[str, Any]], Dict[str, None]]] = None) -> str:
         """Save data as CSV
 
+        Columns appear in the order fields are first seen: the first
+        row's fields in that row's order, then any fields introduced by
+        later rows. Nested dict fields expand to key_subkey columns placed
+        after the row's other fields (for ScrapeResults, after all other
+        columns).
+
         Args:
             data: Data to save
             filename: Base filename
+            timestamp: Filename timestamp (default: now)
+            flat_data: Result of _flatten_data(data), if already computed
 
         Returns:
             Path to saved file
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filepath = self.output_dir / f"{filename}_{timestamp}.csv"
+        timestamp = timestamp or self._timestamp()
+        filepath = f"{self._out}{filename}_{timestamp}.csv"
 
         try:
-            # Flatten nested data for CSV
-            flat_data = self._flatten_data(data)
-
-            if not flat_data:
-                logger.warning("No data to write to CSV")
-                return ""
+            if flat_data is None and isinstance(data, ScrapeResults):
+                if not len(data):
+                    logger.warning("No data to write to CSV")
+                    return ""
+
+                # Write straight from the columns; csv writes None as ''
+                columns = self._flatten_columns(data)
+                fieldnames = list(columns)
+                rows = zip(*columns.values())
+            else:
+                # Flatten nested data for CSV
+                if flat_data is None:
+                    flat_data = self._flatten_data(data)
+                flat_data, fields = flat_data
+
+                if not flat_data:
+                    logger.warning("No data to write to CSV")
+                    return ""
+
+                fieldnames = list(fields)
+
+                # Rows holding every column go through a C-level itemgetter;
+                # only rows with missing keys fall back to per-key lookups
+                width = len(fieldnames)
+                if width == 0:
+                    # Rows without fields; itemgetter() needs at least one key
+                    getter = lambda row: ()
+                elif width == 1:
+                    key = fieldnames[0]
+                    getter = lambda row: (row[key],)
+                else:
+                    getter = operator.itemgetter(*fieldnames)
 
-            # Get all unique keys
-            fieldnames = set()
-            for row in flat_data:
-                fieldnames.update(row.keys())
+                def row_values(row):
+                    if len(row) == width:
+                        return getter(row)
+                    return [row.get(k, '') for k in fieldnames]
 
-            fieldnames = sorted(list(fieldnames))
+                rows = map(row_values, flat_data)
 
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(flat_data)
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(rows)
 
             logger.info(f"✓ CSV saved: {filepath}")
-            return str(filepath)
+            return filepath
 
         except Exception as e:
             logger.error(f"✗ Error saving CSV: {e}")
             return ""
 
-    def _flatten_data(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def save_parquet(self, data: List[Dict[str, Any]], filename: str,
+                     timestamp: Optional[str] = None) -> str:
+        """Save data as a snappy-compressed Parquet file (requires pyarrow)
+
+        Rows are flattened the same way as for CSV. Columns missing from
+        a row are stored as nulls.
+
+        Args:
+            data: Data to save
+            filename: Base filename
+            timestamp: Filename timestamp (default: now)
+
+        Returns:
+            Path to saved file
+        """
+        if pa is None:
+            logger.error("✗ Parquet export requires pyarrow (pip install pyarrow)")
+            return ""
+
+        timestamp = timestamp or self._timestamp()
+        filepath = f"{self._out}{filename}_{timestamp}.parquet"
+
+        try:
+            if isinstance(data, ScrapeResults):
+                columns = self._flatten_columns(data) if len(data) else None
+            else:
+                flat_data, fields = self._flatten_data(data)
+                # Build columns from the full field set; from_pylist would
+                # only take the keys of the first row
+                columns = {
+                    field: [row.get(field) for row in flat_data] for field in fields
+                } if flat_data else None
+
+            if not columns:
+                logger.warning("No data to write to Parquet")
+                return ""
+
+            table = pa.table(columns)
+            pq.write_table(table, filepath, compression='snappy')
+
+            logger.info(f"✓ Parquet saved: {filepath}")
+            return filepath
+
+        except Exception as e:
+            logger.error(f"✗ Error saving Parquet: {e}")
+            return ""
+
+    def _flatten_data(self, data: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, None]]:
         """Flatten nested data structures for CSV export
 
         Args:
             data: Data to flatten
 
         Returns:
-            Flattened data
+            Tuple of (flattened data, every column name seen, as an
+            insertion-ordered dict with None values)
         """
         flattened = []
+        fields = {}
 
         for item in data:
-            flat_item = {}
+            # Copy in one C-level call; scalar fields are final as is and
+            # only collection fields are rewritten below
+            flat_item = dict(item)
 
             for key, value in item.items():
-                if isinstance(value, (list, tuple)):
+                value_type = type(value)
+                if value_type in _SEQ_TYPES:
                     # Convert lists to comma-separated strings
-                    flat_item[key] = ', '.join(str(v) for v in value if v)
-                elif isinstance(value, dict):
+                    flat_item[key] = _join_values(value)
+                elif value_type is dict:
                     # Flatten nested dictionaries
-                    for sub_key, sub_value in value.items():
-                        flat_item[f"{key}_{sub_key}"] = sub_value
-                else:
-                    flat_item[key] = value
+                    del flat_item[key]
+                    flat_item |= {f"{key}_{sub_key}": sub_value for sub_key, sub_value in value.items()}
 
+            fields.update(dict.fromkeys(flat_item))
             flattened.append(flat_item)
 
-        return flattened
+        return flattened, fields
+
 
+    def _flatten_columns(self, results: ScrapeResults) -> Dict[str, List[Any]]:
+        """Flatten ScrapeResults column by column for CSV/Parquet export
+
+        Produces the same fields and values as _flatten_data over the
+        rows, with None where a page lacks a field, without building a
+        dict per page.
+
+        Args:
+            results: Scraped pages
+
+        Returns:
+            Dictionary of column name to values, one per page
+        """
+        count = len(results)
+        columns = {
+            'url': results.urls,
+            'timestamp': results.timestamps,
+            'title': results.titles,
+            'meta_description': results.meta_descriptions,
+        }
+        nested = {}
+
+        for key, column in results.extra.items():
+            flat_column = []
+            has_values = False
+
+            for index, value in enumerate(column):
+                value_type = type(value)
+                if value is _MISSING:
+                    value = None
+                elif value_type in _SEQ_TYPES:
+                    value = _join_values(value)
+                    has_values = True
+                elif value_type is dict:
+                    # Nested dicts become key_subkey columns
+                    for sub_key, sub_value in value.items():
+                        sub_column = nested.get(f"{key}_{sub_key}")
+                        if sub_column is None:
+                            sub_column = nested[f"{key}_{sub_key}"] = [None] * count
+                        sub_column[index] = sub_value
+                    value = None
+                else:
+                    has_values = True
+                flat_column.append(value)
+
+            if has_values:
+                columns[key] = flat_column
+
+        columns['links'] = list(map(_join_values, results.links))
+        columns['images'] = list(map(_join_values, results.images))
+        columns['text_content'] = results.text_contents
+        columns |= nested
+        return columns
     def save_raw_html(self, html: str, url: str) -> str:
         """Save raw HTML content
 
@@ -156,16 +625,19 @@ class DataStorage:
         Returns:
             Path to saved file
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = self._timestamp()
         safe_filename = self._sanitize_filename(url)
-        filepath = self.output_dir / f"html_{safe_filename}_{timestamp}.html"
+        filepath = f"{self._out}html_{safe_filename}_{timestamp}.html"
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html)
+            # Encode once and write in a single call instead of going
+            # through the text-mode codec
+            data = html.encode('utf-8', errors='replace')
+            with open(filepath, 'wb', buffering=_WRITE_BUFFER) as f:
+                f.write(data)
 
             logger.info(f"✓ HTML saved: {filepath}")
-            return str(filepath)
+            return filepath
 
         except Exception as e:
             logger.error(f"✗ Error saving HTML: {e}")
@@ -180,43 +652,121 @@ class DataStorage:
         Returns:
             Safe filename string
         """
-        import re
         # Remove or replace unsafe characters
-        safe = re.sub(r'[^\w\s-]', '', text)
-        safe = re.sub(r'[-\s]+', '_', safe)
+        safe = _UNSAFE_RE.sub('', text)
+        safe = _COLLAPSE_RE.sub('_', safe)
         return safe[:50]  # Limit length
 
     def append_to_json(self, data: Dict[str, Any], filename: str) -> bool:
-        """Append data to existing JSON file
+        """Append a record to a JSON Lines (NDJSON) file
+
+        The record is serialized immediately and queued. A background
+        thread writes queued lines in batches, APPEND_FLUSH_INTERVAL
+        seconds after the first one arrives or as soon as
+        APPEND_BATCH_SIZE lines are waiting. Write errors surface from
+        the next flush() or close(); call close() (or use the storage as
+        a context manager) when done appending.
 
         Args:
             data: Data to append
             filename: Target filename
 
         Returns:
-            True if successful, False otherwise
+            True if the record was queued, False if it could not be serialized
+
+        Raises:
+            ValueError: If the storage has been closed
         """
-        filepath = self.output_dir / filename
+        if self._closed:
+            raise ValueError("append_to_json on closed DataStorage")
 
-        try:
-            existing_data = []
+        filepath = f"{self._out}{filename}"
 
-            if filepath.exists():
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
+        try:
+            line = self._ndjson_line(data)
+        except Exception as e:
+            logger.error(f"✗ Error appending to JSON: {e}")
+            return False
 
-            existing_data.append(data)
+        queue = self._append_queue
+        queue.append((filepath, line))
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(existing_data, f, indent=2, ensure_ascii=False)
+        if self._flusher is None:
+            self._start_flusher()
+        if not self._pending.is_set():
+            self._pending.set()
+        if len(queue) >= APPEND_BATCH_SIZE:
+            self._batch_ready.set()
 
-            return True
+        return True
 
-        except Exception as e:
-            logger.error(f"✗ Error appending to JSON: {e}")
-            return False
+    def flush(self) -> None:
+        """Write all queued append_to_json lines now
 
-    def get_export_summary(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        Raises:
+            OSError: If this write, or a background write since the last
+                flush, failed. Lines of a failed write are dropped.
+        """
+        self._write_queued()
+
+        error, self._flush_error = self._flush_error, None
+        if error is not None:
+            raise error
+
+    def _write_queued(self) -> None:
+        """Write queued lines with one write per file, recording failures"""
+        with self._flush_lock:
+            queue = self._append_queue
+            if not queue:
+                return
+
+            # Pop only what is queued now; appends racing with the flush
+            # stay queued for the next one
+            batches = {}
+            for _ in range(len(queue)):
+                filepath, line = queue.popleft()
+                batches.setdefault(filepath, []).append(line)
+
+            for filepath, lines in batches.items():
+                try:
+                    with open(filepath, 'ab', buffering=_WRITE_BUFFER) as f:
+                        f.write(b''.join(lines))
+                except OSError as e:
+                    logger.error(f"✗ Error appending to JSON: {e}")
+                    if self._flush_error is None:
+                        self._flush_error = e
+
+    def _start_flusher(self) -> None:
+        """Start the background thread draining the append queue"""
+        with self._flush_lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name='storage-flusher', daemon=True
+            )
+            self._flusher.start()
+        # Registered only once there is something to flush; close()
+        # unregisters it so the instance is not kept alive
+        atexit.register(self.flush)
+
+    def _flush_loop(self) -> None:
+        """Write queued lines in batches until close() is called"""
+        while not self._closed:
+            # Sleep without polling until something is queued
+            if not self._append_queue:
+                self._pending.wait()
+            self._pending.clear()
+            if self._closed:
+                return
+
+            # Give the batch a moment to fill unless it is already full
+            if len(self._append_queue) < APPEND_BATCH_SIZE:
+                self._batch_ready.wait(APPEND_FLUSH_INTERVAL)
+            self._batch_ready.clear()
+
+            self._write_queued()
+
+    def get_export_summary(self, data: Union[ScrapeResults, List[Dict[str, Any]]]) -> Dict[str, Any]:
         """Generate summary statistics of scraped data
 
         Args:
@@ -232,19 +782,36 @@ class DataStorage:
                 'total_images': 0
             }
 
-        total_links = sum(len(item.get('links', [])) for item in data)
-        total_images = sum(len(item.get('images', [])) for item in data)
+        if isinstance(data, ScrapeResults):
+            # Read the columns directly instead of rebuilding page dicts
+            return {
+                'total_pages': len(data),
+                'total_links': sum(map(len, data.links)),
+                'total_images': sum(map(len, data.images)),
+                'pages': [
+                    {'url': url, 'title': title, 'timestamp': timestamp}
+                    for url, title, timestamp in zip(data.urls, data.titles, data.timestamps)
+                ]
+            }
+
+        # Single pass; no default [] allocated for missing keys
+        total_links = total_images = 0
+        pages = []
+        append = pages.append
+
+        for item in data:
+            get = item.get
+            links = get('links')
+            images = get('images')
+            if links:
+                total_links += len(links)
+            if images:
+                total_images += len(images)
+            append({'url': get('url'), 'title': get('title'), 'timestamp': get('timestamp')})
 
         return {
             'total_pages': len(data),
             'total_links': total_links,
             'total_images': total_images,
-            'pages': [
-                {
-                    'url': item.get('url'),
-                    'title': item.get('title'),
-                    'timestamp': item.get('timestamp')
-                }
-                for item in data
-            ]
+            'pages': pages
         }